@@ -1,6 +1,7 @@
 #!/bin/env python3
 
 import argparse;
+import sys
 
 
 def colorify(string, color):
@@ -32,13 +33,18 @@ def header_size(count = 1):
     return 12 * count
 
 
-def get_header_tables(help_file, count):
-    '''Read in the header tables for the help file and return them'''
+def get_header_tables(help_file, count, raw=False):
+    '''Read in the header tables for the help file and return them
+
+    If raw is set, codes are returned as undecoded bytes.
+    '''
     HEADER_START = 4
     HEADER_SIZE = header_size(1)
     headers = []
     for i in range(count):
-        code = help_file.read(6).decode().rstrip('\0')
+        code = help_file.read(6).rstrip(b'\0')
+        if not raw:
+            code = code.decode()
         offset = int.from_bytes(help_file.read(4), byteorder='little')
         size = int.from_bytes(help_file.read(2), byteorder='little')
         headers.append((code, offset, size))
@@ -61,6 +67,85 @@ def get_records(help_file, headers):
     return records
 
 
+def get_file_size(help_file):
+    '''Return the total size of the file in bytes'''
+    position = help_file.tell()
+    size = help_file.seek(0, 2)
+    help_file.seek(position)
+    return size
+
+
+def check_file(help_file):
+    '''Validate the header tables without decoding any record text
+
+    Returns a tuple of (errors, warnings), each a list of messages.
+    '''
+    errors = []
+    warnings = []
+    file_size = get_file_size(help_file)
+    if file_size < 4:
+        errors.append('File is too small to hold a record count')
+        return errors, warnings
+    count = get_record_count(help_file)
+    table_end = 4 + header_size(count)
+    if table_end > file_size:
+        errors.append('Record count {} needs {} bytes of headers but file '
+                'is only {} bytes'.format(count, table_end, file_size))
+        return errors, warnings
+    headers = get_header_tables(help_file, count, raw=True)
+
+    def name(index):
+        code = headers[index][0].decode('ascii', errors='backslashreplace')
+        return '{} (header {})'.format(code, index)
+
+    seen = {}
+    for index, header in enumerate(headers):
+        code, offset, size = header
+        if any(byte > 127 for byte in code):
+            errors.append('{} has a non-ASCII code'.format(name(index)))
+        if code in seen:
+            errors.append('{} duplicates the code of {}'.format(
+                name(index), name(seen[code])))
+        else:
+            seen[code] = index
+        if offset < table_end:
+            errors.append('{} body at offset {} begins inside the header '
+                    'table'.format(name(index), offset))
+        elif offset + size > file_size:
+            errors.append('{} body at offset {} with size {} runs past end '
+                    'of file ({} bytes)'.format(
+                        name(index), offset, size, file_size))
+
+    # Walk the bodies in file order, tracking the furthest byte covered so
+    # far and the header responsible for it
+    ordered = sorted(range(count),
+            key=lambda i: (headers[i][1], headers[i][2]))
+    position = table_end
+    last = None
+    for index in ordered:
+        code, offset, size = headers[index]
+        if offset < table_end:
+            continue
+        if offset > position:
+            warnings.append('{} unused bytes at offset {}'.format(
+                offset - position, position))
+        elif last is not None and offset < position:
+            _, last_offset, last_size = headers[last]
+            if offset == last_offset and size == last_size:
+                errors.append('{} shares its body with {}'.format(
+                    name(index), name(last)))
+            else:
+                errors.append('{} overlaps the body of {}'.format(
+                    name(index), name(last)))
+        if offset + size > position:
+            position = offset + size
+            last = index
+    if position < file_size:
+        warnings.append('{} unused bytes at offset {}'.format(
+            file_size - position, position))
+    return errors, warnings
+
+
 def write_record_text(text, colorize=False, number_lines=False):
     lines = text.split('\n')
     line_number = 0
@@ -95,6 +180,19 @@ def main(args):
     """Output the file in a readable manner"""
     filename = args.filename
     with open(filename, 'rb') as f:
+        if args.check:
+            errors, warnings = check_file(f)
+            for message in errors:
+                print('{}: {}'.format(
+                    colorify('Error', 'red') if args.color else 'Error',
+                    message),
+                    file=sys.stderr)
+            for message in warnings:
+                print('{}: {}'.format(
+                    colorify('Warning', 'yellow') if args.color else 'Warning',
+                    message),
+                    file=sys.stderr)
+            return 1 if errors else 0
         # Read the file
         count = get_record_count(f)
         headers = get_header_tables(f, count)
@@ -131,5 +229,7 @@ if __name__ == '__main__':
             help='Print only header data')
     parser.add_argument('--header',
             help='Select a specific header to view')
+    parser.add_argument('--check', action='store_true',
+            help='Validate the header tables without decoding any text')
     args = parser.parse_args()
-    main(args)
+    sys.exit(main(args))
@@ -0,0 +1,79 @@
+import io
+import unittest
+
+from readfile import check_file
+
+
+def build_file(headers, body, count=None):
+    """Assemble a binary help file from header tuples and body bytes"""
+    count = len(headers) if count is None else count
+    data = count.to_bytes(4, byteorder='little')
+    for code, offset, size in headers:
+        data += code.ljust(6, b'\0')
+        data += offset.to_bytes(4, byteorder='little')
+        data += size.to_bytes(2, byteorder='little')
+    return io.BytesIO(data + body)
+
+
+class TestCheckFile(unittest.TestCase):
+
+    def test_valid_file(self):
+        """A well-formed file produces no errors or warnings"""
+        src = build_file([(b'A001', 28, 3), (b'A002', 31, 2)], b'abcde')
+        self.assertEqual(check_file(src), ([], []))
+
+    def test_count_exceeds_file_size(self):
+        """A record count larger than the header table fails"""
+        src = build_file([(b'A001', 16, 0)], b'', count=50)
+        errors, _ = check_file(src)
+        self.assertEqual(errors, ['Record count 50 needs 604 bytes of headers '
+                'but file is only 16 bytes'])
+
+    def test_body_past_end_of_file(self):
+        """A body running past the end of the file is reported"""
+        src = build_file([(b'A001', 16, 10)], b'abc')
+        errors, _ = check_file(src)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('past end of file', errors[0])
+
+    def test_overlapping_bodies(self):
+        """Bodies sharing or overlapping byte ranges are reported"""
+        src = build_file([(b'A001', 40, 4), (b'A002', 42, 2),
+                (b'A003', 40, 4)], b'abcd')
+        errors, _ = check_file(src)
+        self.assertEqual(len(errors), 2)
+        self.assertTrue(any('shares' in error for error in errors))
+        self.assertTrue(any('overlaps' in error for error in errors))
+
+    def test_duplicate_codes(self):
+        """Identical codes are reported as duplicates"""
+        src = build_file([(b'A001', 28, 1), (b'A001', 29, 1)], b'ab')
+        errors, _ = check_file(src)
+        self.assertEqual(errors, ['A001 (header 1) duplicates the code of '
+                'A001 (header 0)'])
+
+    def test_codes_are_case_sensitive(self):
+        """Codes differing only in case are not duplicates"""
+        src = build_file([(b'A001', 28, 1), (b'a001', 29, 1)], b'ab')
+        self.assertEqual(check_file(src), ([], []))
+
+    def test_non_ascii_code(self):
+        """Codes containing non-ASCII bytes are reported"""
+        src = build_file([(b'A\xff01', 16, 1)], b'a')
+        errors, _ = check_file(src)
+        self.assertEqual(len(errors), 1)
+        self.assertIn('non-ASCII', errors[0])
+
+    def test_unused_gaps(self):
+        """Unreferenced bytes between and after bodies are warned about"""
+        src = build_file([(b'A001', 30, 2), (b'A002', 34, 1)], b'xxabxxcxx')
+        errors, warnings = check_file(src)
+        self.assertEqual(errors, [])
+        self.assertEqual(warnings, [
+            '2 unused bytes at offset 28',
+            '2 unused bytes at offset 32',
+            '2 unused bytes at offset 35'])
+
+
+if __name__ == '__main__':
+    unittest.main()